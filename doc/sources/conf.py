@@ -56,6 +56,9 @@ release = "2024.3.0"
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
+# All of the extensions below declare parallel_read_safe/parallel_write_safe
+# in their setup(), so the build can run with "-j auto" (see SPHINXJOBS in
+# doc/Makefile). Check this when adding a new extension.
 extensions = [
     "sphinx.ext.todo",
     "sphinx.ext.coverage",
@@ -16,6 +16,7 @@
 
 # daal4py PCA example for shared memory systems
 
+import os
 from pathlib import Path
 
 import numpy as np
@@ -24,7 +25,7 @@ from readcsv import pd_read_csv
 import daal4py as d4p
 
 
-def main(readcsv=pd_read_csv):
+def main(readcsv=pd_read_csv, verify_equivalence=True):
     data_path = Path(__file__).parent / "data" / "batch"
     infile = data_path / "pca_normalized.csv"
 
@@ -41,25 +42,32 @@ def main(readcsv=pd_read_csv):
     # let's provide a file directly, not a table/array
     result1 = algo.compute(str(infile))
 
-    # We can also load the data ourselfs and provide the numpy array
-    data = readcsv(infile)
-    result2 = algo.compute(data)
+    # We can also load the data ourselfs and provide the numpy array.
+    # It gives the same result, so the script only does it to check the
+    # equivalence instead of computing PCA twice.
+    if verify_equivalence:
+        data = readcsv(infile)
+        result2 = algo.compute(data)
+
+        assert np.allclose(result1.eigenvalues, result2.eigenvalues)
+        assert np.allclose(result1.eigenvectors, result2.eigenvectors)
+        assert np.allclose(result1.means, result2.means)
+        assert np.allclose(result1.variances, result2.variances)
+        n_features = data.shape[1]
+    else:
+        n_features = result1.eigenvalues.shape[1]
 
     # PCA result objects provide eigenvalues, eigenvectors, means and variances
-    assert np.allclose(result1.eigenvalues, result2.eigenvalues)
-    assert np.allclose(result1.eigenvectors, result2.eigenvectors)
-    assert np.allclose(result1.means, result2.means)
-    assert np.allclose(result1.variances, result2.variances)
-    assert result1.eigenvalues.shape == (1, data.shape[1])
-    assert result1.eigenvectors.shape == (data.shape[1], data.shape[1])
-    assert result1.means.shape == (1, data.shape[1])
-    assert result1.variances.shape == (1, data.shape[1])
+    assert result1.eigenvalues.shape == (1, n_features)
+    assert result1.eigenvectors.shape == (n_features, n_features)
+    assert result1.means.shape == (1, n_features)
+    assert result1.variances.shape == (1, n_features)
 
     return result1
 
 
 if __name__ == "__main__":
-    result1 = main()
+    result1 = main(verify_equivalence=os.environ.get("VERIFY_EQUIVALENCE") == "1")
     print("\nEigenvalues:\n", result1.eigenvalues)
     print("\nEigenvectors:\n", result1.eigenvectors)
     print("\nMeans:\n", result1.means)
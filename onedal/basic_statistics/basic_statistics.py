@@ -70,15 +70,15 @@ class BaseBasicStatistics(metaclass=ABCMeta):
 
         result = module.train(policy, params, data_table, weights_table)
 
-        options = self._get_result_options(self.options)
-        options = options.split("|")
+        options = params["result_option"].split("|")
 
         return {opt: getattr(result, opt) for opt in options}
 
     def _compute(self, data, weights, module, queue):
         policy = self._get_policy(queue, data, weights)
 
-        is_csr = _is_csr(data)
+        # dense numpy input is the common case and needs no sparse probing
+        is_csr = not isinstance(data, np.ndarray) and _is_csr(data)
         if not (data is None) and not is_csr:
             data = np.asarray(data)
 
@@ -172,7 +172,7 @@ class IncrementalBasicStatistics(BaseBasicStatistics):
         result = _backend.basic_statistics.compute.finalize_compute(
             self._policy, self._onedal_params, self._partial_result
         )
-        options = self._get_result_options(self.options).split("|")
+        options = self._onedal_params["result_option"].split("|")
         for opt in options:
             setattr(self, opt, from_table(getattr(result, opt)).ravel())
 
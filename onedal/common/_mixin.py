@@ -14,6 +14,8 @@
 # limitations under the License.
 # ==============================================================================
 
+from ..datatypes import from_table, to_table
+
 
 class ClusterMixin:
     _estimator_type = "clusterer"
@@ -60,3 +62,37 @@ class TransformerMixin:
             return self.fit(X, queue=queue, **fit_params).transform(X, queue=queue)
         else:
             return self.fit(X, y, queue=queue, **fit_params).transform(X, queue=queue)
+
+
+class PartialResultPickleMixin:
+    """Pickles an incremental estimator without finalizing its partial result.
+
+    Backend objects are not picklable, so they are dropped from the state and
+    the ``_partial_result_fields`` of the partial result are stored as numpy
+    arrays. The partial result is only stored once the first batch has set
+    ``_params``. ``_restore_backend`` recreates the backend objects and an
+    empty partial result on unpickling.
+    """
+
+    _partial_result_fields = ()
+    _backend_attrs = ("_module", "_policy", "_partial_result")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attr in self._backend_attrs:
+            state.pop(attr, None)
+        if getattr(self, "_params", None) is not None:
+            state["_partial_result"] = {
+                field: from_table(getattr(self._partial_result, field))
+                for field in self._partial_result_fields
+            }
+        return state
+
+    def __setstate__(self, state):
+        state = state.copy()
+        partial_result = state.pop("_partial_result", None)
+        self.__dict__.update(state)
+        self._restore_backend()
+        if partial_result is not None:
+            for field in self._partial_result_fields:
+                setattr(self._partial_result, field, to_table(partial_result[field]))
@@ -16,11 +16,14 @@
 
 import sys
 
+import numpy as np
+
 from onedal import _backend, _is_dpc_backend
 
 
 def _get_policy(queue, *data):
-    data_queue = _get_queue(*data)
+    # an explicit queue takes precedence, the data is only probed without one
+    data_queue = _get_queue(*data) if queue is None else None
     if _is_dpc_backend:
         if queue is None:
             if data_queue is None:
@@ -36,7 +39,10 @@ def _get_policy(queue, *data):
 
 
 def _get_queue(*data):
-    if len(data) > 0 and hasattr(data[0], "__sycl_usm_array_interface__"):
+    # plain numpy arrays never carry a SYCL queue, skip the attribute probe
+    if len(data) == 0 or isinstance(data[0], np.ndarray):
+        return None
+    if hasattr(data[0], "__sycl_usm_array_interface__"):
         # Assume that all data reside on the same device
         return data[0].__sycl_usm_array_interface__["syclobj"]
     return None
@@ -113,12 +113,10 @@ class EmpiricalCovariance(BaseEmpiricalCovariance):
             result = self._get_backend(
                 "covariance", None, "compute", policy, params, to_table(X)
             )
-        if daal_check_version((2024, "P", 1)) or (not self.bias):
-            self.covariance_ = from_table(result.cov_matrix)
-        else:
-            self.covariance_ = (
-                from_table(result.cov_matrix) * (X.shape[0] - 1) / X.shape[0]
-            )
+        self.covariance_ = from_table(result.cov_matrix)
+        if not daal_check_version((2024, "P", 1)) and self.bias:
+            # oneDAL applies the bias itself starting from 2024.1
+            self.covariance_ *= (X.shape[0] - 1) / X.shape[0]
 
         self.location_ = from_table(result.means).ravel()
 
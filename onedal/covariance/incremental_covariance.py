@@ -18,12 +18,13 @@ import numpy as np
 from daal4py.sklearn._utils import daal_check_version, get_dtype, make2d
 from onedal import _backend
 
+from ..common._mixin import PartialResultPickleMixin
 from ..datatypes import _convert_to_supported, from_table, to_table
 from ..utils import _check_array
 from .covariance import BaseEmpiricalCovariance
 
 
-class IncrementalEmpiricalCovariance(BaseEmpiricalCovariance):
+class IncrementalEmpiricalCovariance(PartialResultPickleMixin, BaseEmpiricalCovariance):
     """
     Covariance estimator based on oneDAL implementation.
 
@@ -55,14 +56,21 @@ class IncrementalEmpiricalCovariance(BaseEmpiricalCovariance):
 
     def __init__(self, method="dense", bias=False, assume_centered=False):
         super().__init__(method, bias, assume_centered)
+        self._module = self._get_backend("covariance", None)
         self._reset()
 
     def _reset(self):
-        self._partial_result = self._get_backend(
-            "covariance", None, "partial_compute_result"
-        )
+        self._partial_result = self._module.partial_compute_result()
+        if hasattr(self, "_dtype"):
+            del self._dtype, self._params
+
+    _partial_result_fields = ("partial_n_rows", "partial_crossproduct", "partial_sums")
+
+    def _restore_backend(self):
+        self._module = self._get_backend("covariance", None)
+        self._partial_result = self._module.partial_compute_result()
 
-    def partial_fit(self, X, y=None, queue=None):
+    def partial_fit(self, X, y=None, queue=None, check_input=True):
         """
         Computes partial data for the covariance matrix
         from data batch X and saves it to `_partial_result`.
@@ -79,12 +87,17 @@ class IncrementalEmpiricalCovariance(BaseEmpiricalCovariance):
         queue : dpctl.SyclQueue
             If not None, use this queue for computations.
 
+        check_input : bool, default=True
+            Run _check_array on X. Only disable it if X is already a
+            validated, finite float64 or float32 2d array.
+
         Returns
         -------
         self : object
             Returns the instance itself.
         """
-        X = _check_array(X, dtype=[np.float64, np.float32], ensure_2d=True)
+        if check_input:
+            X = _check_array(X, dtype=[np.float64, np.float32], ensure_2d=True)
 
         if not hasattr(self, "_policy"):
             self._policy = self._get_policy(queue, X)
@@ -93,17 +106,11 @@ class IncrementalEmpiricalCovariance(BaseEmpiricalCovariance):
 
         if not hasattr(self, "_dtype"):
             self._dtype = get_dtype(X)
+            self._params = self._get_onedal_params(self._dtype)
 
-        params = self._get_onedal_params(self._dtype)
         table_X = to_table(X)
-        self._partial_result = self._get_backend(
-            "covariance",
-            None,
-            "partial_compute",
-            self._policy,
-            params,
-            self._partial_result,
-            table_X,
+        self._partial_result = self._module.partial_compute(
+            self._policy, self._params, self._partial_result, table_X
         )
 
     def finalize_fit(self, queue=None):
@@ -114,27 +121,25 @@ class IncrementalEmpiricalCovariance(BaseEmpiricalCovariance):
         Parameters
         ----------
         queue : dpctl.SyclQueue
-            Not used here, added for API conformance
+            Only used if the estimator was unpickled without any
+            partial_fit call after that.
 
         Returns
         -------
         self : object
             Returns the instance itself.
         """
-        params = self._get_onedal_params(self._dtype)
-        result = self._get_backend(
-            "covariance",
-            None,
-            "finalize_compute",
-            self._policy,
-            params,
-            self._partial_result,
+        if not hasattr(self, "_policy"):
+            self._policy = self._get_policy(queue)
+
+        result = self._module.finalize_compute(
+            self._policy, self._params, self._partial_result
         )
-        if daal_check_version((2024, "P", 1)) or (not self.bias):
-            self.covariance_ = from_table(result.cov_matrix)
-        else:
-            n_rows = self._partial_result.partial_n_rows
-            self.covariance_ = from_table(result.cov_matrix) * (n_rows - 1) / n_rows
+        self.covariance_ = from_table(result.cov_matrix)
+        if not daal_check_version((2024, "P", 1)) and self.bias:
+            # oneDAL applies the bias itself starting from 2024.1
+            n_rows = from_table(self._partial_result.partial_n_rows).item()
+            self.covariance_ *= (n_rows - 1) / n_rows
 
         self.location_ = from_table(result.means).ravel()
 
@@ -14,25 +14,37 @@
 # limitations under the License.
 # ===============================================================================
 
+from functools import lru_cache
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
+from onedal.datatypes import from_table
 from onedal.tests.utils._device_selection import get_queues
 
 
+def _iter_chunks(X, n):
+    # Same partitioning as np.array_split, but yields row views lazily.
+    k, m = divmod(X.shape[0], n)
+    start = 0
+    for i in range(n):
+        stop = start + k + (i < m)
+        yield X[start:stop]
+        start = stop
+
+
 @pytest.mark.parametrize("queue", get_queues())
 @pytest.mark.parametrize("dtype", [np.float32, np.float64])
 def test_on_gold_data_unbiased(queue, dtype):
     from onedal.covariance import IncrementalEmpiricalCovariance
 
     X = np.array([[0, 1], [0, 1]])
-    X_split = np.array_split(X, 2)
     X = X.astype(dtype)
     inccov = IncrementalEmpiricalCovariance()
 
-    for i in range(2):
-        inccov.partial_fit(X_split[i], queue=queue)
+    for chunk in _iter_chunks(X, 2):
+        inccov.partial_fit(chunk, queue=queue)
     result = inccov.finalize_fit()
 
     expected_covariance = np.array([[0, 0], [0, 0]])
@@ -42,12 +54,11 @@ def test_on_gold_data_unbiased(queue, dtype):
     assert_allclose(expected_means, result.location_)
 
     X = np.array([[1, 2], [3, 6]])
-    X_split = np.array_split(X, 2)
     X = X.astype(dtype)
     inccov = IncrementalEmpiricalCovariance()
 
-    for i in range(2):
-        inccov.partial_fit(X_split[i], queue=queue)
+    for chunk in _iter_chunks(X, 2):
+        inccov.partial_fit(chunk, queue=queue)
     result = inccov.finalize_fit()
 
     expected_covariance = np.array([[2, 4], [4, 8]])
@@ -64,11 +75,10 @@ def test_on_gold_data_biased(queue, dtype):
 
     X = np.array([[0, 1], [0, 1]])
     X = X.astype(dtype)
-    X_split = np.array_split(X, 2)
     inccov = IncrementalEmpiricalCovariance(bias=True)
 
-    for i in range(2):
-        inccov.partial_fit(X_split[i], queue=queue)
+    for chunk in _iter_chunks(X, 2):
+        inccov.partial_fit(chunk, queue=queue)
     result = inccov.finalize_fit()
 
     expected_covariance = np.array([[0, 0], [0, 0]])
@@ -79,11 +89,10 @@ def test_on_gold_data_biased(queue, dtype):
 
     X = np.array([[1, 2], [3, 6]])
     X = X.astype(dtype)
-    X_split = np.array_split(X, 2)
     inccov = IncrementalEmpiricalCovariance(bias=True)
 
-    for i in range(2):
-        inccov.partial_fit(X_split[i], queue=queue)
+    for chunk in _iter_chunks(X, 2):
+        inccov.partial_fit(chunk, queue=queue)
     result = inccov.finalize_fit()
 
     expected_covariance = np.array([[1, 2], [2, 4]])
@@ -93,30 +102,99 @@ def test_on_gold_data_biased(queue, dtype):
     assert_allclose(expected_means, result.location_)
 
 
+_random_data_shapes = [
+    (row_count, column_count)
+    for row_count in [100, 1000, 2000]
+    for column_count in [10, 100, 200]
+]
+
+
+@lru_cache(maxsize=None)
+def _random_data(shape):
+    # Generated once per shape and shared by the rest of the parametrization,
+    # tests must not modify it in place.
+    seed = 77
+    gen = np.random.default_rng(seed)
+    return gen.uniform(low=-0.3, high=+0.7, size=shape)
+
+
+def _cov_posthoc(X, bias):
+    # X.T @ X - n * mu @ mu.T avoids the centered copy of X that np.cov
+    # makes; it is evaluated in float64 so the cancellation in the
+    # subtraction stays far below the test tolerance.
+    X = X.astype(np.float64, copy=False)
+    n = X.shape[0]
+    mu = X.mean(axis=0)
+    C = X.T @ X
+    C -= n * np.outer(mu, mu)
+    C /= n if bias else n - 1
+    return C, mu
+
+
+@lru_cache(maxsize=None)
+def _expected_results(shape, bias, dtype):
+    X = _random_data(shape).astype(dtype, copy=False)
+    return _cov_posthoc(X, bias)
+
+
 @pytest.mark.parametrize("queue", get_queues())
 @pytest.mark.parametrize("num_batches", [2, 4, 6, 8, 10])
-@pytest.mark.parametrize("row_count", [100, 1000, 2000])
-@pytest.mark.parametrize("column_count", [10, 100, 200])
+@pytest.mark.parametrize(
+    "shape",
+    _random_data_shapes,
+    ids=[f"{shape[0]}x{shape[1]}" for shape in _random_data_shapes],
+)
 @pytest.mark.parametrize("bias", [True, False])
 @pytest.mark.parametrize("dtype", [np.float32, np.float64])
-def test_partial_fit_on_random_data(
-    queue, num_batches, row_count, column_count, bias, dtype
-):
+def test_partial_fit_on_random_data(queue, num_batches, shape, bias, dtype):
     from onedal.covariance import IncrementalEmpiricalCovariance
 
-    seed = 77
-    gen = np.random.default_rng(seed)
-    X = gen.uniform(low=-0.3, high=+0.7, size=(row_count, column_count))
-    X = X.astype(dtype)
-    X_split = np.array_split(X, num_batches)
+    X = _random_data(shape).astype(dtype, copy=False)
     inccov = IncrementalEmpiricalCovariance(bias=bias)
 
-    for i in range(num_batches):
-        inccov.partial_fit(X_split[i], queue=queue)
+    for chunk in _iter_chunks(X, num_batches):
+        inccov.partial_fit(chunk, queue=queue)
     result = inccov.finalize_fit()
 
-    expected_covariance = np.cov(X.T, bias=bias)
-    expected_means = np.mean(X, axis=0)
+    expected_covariance, expected_means = _expected_results(shape, bias, dtype)
 
     assert_allclose(expected_covariance, result.covariance_, atol=1e-6)
     assert_allclose(expected_means, result.location_, atol=1e-6)
+
+
+@pytest.mark.parametrize("queue", get_queues())
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_incremental_estimator_pickle(queue, dtype):
+    import pickle
+
+    from onedal.covariance import IncrementalEmpiricalCovariance
+
+    inccov = IncrementalEmpiricalCovariance()
+
+    # Check that estimator can be serialized without any data.
+    dump = pickle.dumps(inccov)
+    inccov_loaded = pickle.loads(dump)
+    seed = 77
+    gen = np.random.default_rng(seed)
+    X = gen.uniform(low=-0.3, high=+0.7, size=(10, 10))
+    X = X.astype(dtype)
+    X_first, X_second = _iter_chunks(X, 2)
+    inccov.partial_fit(X_first, queue=queue)
+    inccov_loaded.partial_fit(X_first, queue=queue)
+
+    # Check that estimator can be serialized after partial_fit call.
+    dump = pickle.dumps(inccov)
+    inccov_loaded = pickle.loads(dump)
+    assert_allclose(
+        from_table(inccov._partial_result.partial_sums),
+        from_table(inccov_loaded._partial_result.partial_sums),
+    )
+
+    inccov.partial_fit(X_second, queue=queue)
+    inccov_loaded.partial_fit(X_second, queue=queue)
+    inccov.finalize_fit()
+    inccov_loaded.finalize_fit()
+
+    # Check that finalized estimators produce the same results.
+    assert_allclose(inccov.covariance_, inccov_loaded.covariance_)
+    assert_allclose(inccov.location_, inccov_loaded.location_)
@@ -43,6 +43,12 @@ def from_table(*args):
 
 
 def convert_one_to_table(arg):
+    # C- and F-contiguous numpy arrays are wrapped by the backend
+    # without a copy, the probes below are only needed for other types.
+    # None (e.g. absent sample weights) maps to an empty table.
+    if arg is None or isinstance(arg, np.ndarray):
+        return _backend.to_table(make2d(arg))
+
     if dpctl_available:
         if isinstance(arg, dpt.usm_ndarray):
             return _backend.dpctl_to_table(arg)
@@ -18,13 +18,14 @@ import numpy as np
 
 from daal4py.sklearn._utils import get_dtype
 
+from ..common._mixin import PartialResultPickleMixin
 from ..common.hyperparameters import get_hyperparameters
 from ..datatypes import _convert_to_supported, from_table, to_table
 from ..utils import _check_X_y, _num_features
 from .linear_model import BaseLinearRegression
 
 
-class IncrementalLinearRegression(BaseLinearRegression):
+class IncrementalLinearRegression(PartialResultPickleMixin, BaseLinearRegression):
     """
     Incremental Linear Regression oneDAL implementation.
 
@@ -43,15 +44,34 @@ class IncrementalLinearRegression(BaseLinearRegression):
     """
 
     def __init__(self, fit_intercept=True, copy_X=False, algorithm="norm_eq"):
-        module = self._get_backend("linear_model", "regression")
         super().__init__(fit_intercept=fit_intercept, copy_X=copy_X, algorithm=algorithm)
-        self._partial_result = module.partial_train_result()
+        self._module = self._get_backend("linear_model", "regression")
+        self._reset()
+
+    _partial_result_fields = ("partial_xtx", "partial_xty")
+    _backend_attrs = PartialResultPickleMixin._backend_attrs + ("_hparams_args",)
 
     def _reset(self):
-        module = self._get_backend("linear_model", "regression")
-        self._partial_result = module.partial_train_result()
+        self._partial_result = self._module.partial_train_result()
+        # the policy and oneDAL parameters are built once per fit, on the
+        # first batch, so a refit may target another queue or dtype
+        self._policy = None
+        self._dtype = None
+        self._params = None
+
+    def _restore_backend(self):
+        self._module = self._get_backend("linear_model", "regression")
+        self._partial_result = self._module.partial_train_result()
+        self._policy = None
+        self._hparams_args = self._get_hparams_args()
+
+    def _get_hparams_args(self):
+        hparams = get_hyperparameters("linear_regression", "train")
+        if hparams is not None and not hparams.is_default:
+            return (hparams.backend,)
+        return ()
 
-    def partial_fit(self, X, y, queue=None):
+    def partial_fit(self, X, y, queue=None, check_input=True):
         """
         Computes partial data for linear regression
         from data batch X and saves it to `_partial_result`.
@@ -67,43 +87,53 @@ class IncrementalLinearRegression(BaseLinearRegression):
 
         queue : dpctl.SyclQueue
             If not None, use this queue for computations.
+
+        check_input : bool, default=True
+            Run _check_X_y on X and y. Only disable it if X and y are
+            already validated, finite float64 or float32 arrays.
+
         Returns
         -------
         self : object
             Returns the instance itself.
         """
-        module = self._get_backend("linear_model", "regression")
-
-        if not hasattr(self, "_policy"):
+        if self._policy is None:
             self._policy = self._get_policy(queue, X)
 
         X, y = _convert_to_supported(self._policy, X, y)
+        y = np.asarray(y)
 
-        if not hasattr(self, "_dtype"):
+        if check_input:
+            X, y = _check_X_y(X, y, dtype=[np.float64, np.float32], accept_2d_y=True)
+
+        if self._params is None:
+            # the dtype is taken from the validated X, non-float input has
+            # already been converted to float64 by _check_X_y
             self._dtype = get_dtype(X)
             self._params = self._get_onedal_params(self._dtype)
+            self._hparams_args = self._get_hparams_args()
 
-        y = np.asarray(y).astype(dtype=self._dtype)
+        # only copy y if it has to be converted, to_table wraps
+        # contiguous arrays as they are
+        y = np.asarray(y, dtype=self._dtype)
+        if not (y.flags.c_contiguous or y.flags.f_contiguous):
+            y = np.ascontiguousarray(y)
         self._y_ndim_1 = y.ndim == 1
 
-        X, y = _check_X_y(X, y, dtype=[np.float64, np.float32], accept_2d_y=True)
+        if isinstance(X, np.ndarray) and X.dtype != self._dtype:
+            # the partial result is accumulated in the dtype of the first batch
+            X = X.astype(self._dtype)
 
         self.n_features_in_ = _num_features(X, fallback_1d=True)
         X_table, y_table = to_table(X, y)
-        hparams = get_hyperparameters("linear_regression", "train")
-        if hparams is not None and not hparams.is_default:
-            self._partial_result = module.partial_train(
-                self._policy,
-                self._params,
-                hparams.backend,
-                self._partial_result,
-                X_table,
-                y_table,
-            )
-        else:
-            self._partial_result = module.partial_train(
-                self._policy, self._params, self._partial_result, X_table, y_table
-            )
+        self._partial_result = self._module.partial_train(
+            self._policy,
+            self._params,
+            *self._hparams_args,
+            self._partial_result,
+            X_table,
+            y_table,
+        )
 
     def finalize_fit(self, queue=None):
         """
@@ -113,34 +143,31 @@ class IncrementalLinearRegression(BaseLinearRegression):
         Parameters
         ----------
         queue : dpctl.SyclQueue
-            Not used here, added for API conformance
+            If not None, use this queue for computations. Only used if
+            the estimator was unpickled since the last `partial_fit`.
 
         Returns
         -------
         self : object
             Returns the instance itself.
         """
-        module = self._get_backend("linear_model", "regression")
-        hparams = get_hyperparameters("linear_regression", "train")
-        if hparams is not None and not hparams.is_default:
-            result = module.finalize_train(
-                self._policy, self._params, hparams.backend, self._partial_result
-            )
-        else:
-            result = module.finalize_train(
-                self._policy, self._params, self._partial_result
-            )
+        if self._policy is None:
+            self._policy = self._get_policy(queue)
+
+        result = self._module.finalize_train(
+            self._policy, self._params, *self._hparams_args, self._partial_result
+        )
 
         self._onedal_model = result.model
 
         packed_coefficients = from_table(result.model.packed_coefficients)
-        self.coef_, self.intercept_ = (
-            packed_coefficients[:, 1:],
-            packed_coefficients[:, 0],
-        )
-
-        if self.coef_.shape[0] == 1 and self._y_ndim_1:
-            self.coef_ = self.coef_.ravel()
-            self.intercept_ = self.intercept_[0]
+        if packed_coefficients.shape[0] == 1 and self._y_ndim_1:
+            self.coef_ = packed_coefficients[0, 1:]
+            self.intercept_ = packed_coefficients[0, 0]
+        else:
+            self.coef_, self.intercept_ = (
+                packed_coefficients[:, 1:],
+                packed_coefficients[:, 0],
+            )
 
         return self
@@ -45,9 +45,7 @@ def test_diabetes(queue, dtype):
 
 @pytest.mark.parametrize("queue", get_queues())
 @pytest.mark.parametrize("dtype", [np.float32, np.float64])
-@pytest.mark.skip(reason="pickling not implemented for oneDAL entities")
 def test_pickle(queue, dtype):
-    # TODO Implement pickling for oneDAL entities
     X, y = load_diabetes(return_X_y=True)
     X, y = X.astype(dtype), y.astype(dtype)
     model = IncrementalLinearRegression(fit_intercept=True)
@@ -66,6 +64,36 @@ def test_pickle(queue, dtype):
     assert_array_equal(expected, result)
 
 
+@pytest.mark.parametrize("queue", get_queues())
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_pickle_partial_fit(queue, dtype):
+    import pickle
+
+    X, y = load_diabetes(return_X_y=True)
+    X, y = X.astype(dtype), y.astype(dtype)
+    X_split = np.array_split(X, 2)
+    y_split = np.array_split(y, 2)
+
+    model = IncrementalLinearRegression(fit_intercept=True)
+
+    # Check that estimator can be serialized without any data.
+    model2 = pickle.loads(pickle.dumps(model))
+
+    model.partial_fit(X_split[0], y_split[0], queue=queue)
+    model2.partial_fit(X_split[0], y_split[0], queue=queue)
+
+    # Check that estimator can be serialized between partial_fit calls.
+    model2 = pickle.loads(pickle.dumps(model2))
+
+    model.partial_fit(X_split[1], y_split[1], queue=queue)
+    model2.partial_fit(X_split[1], y_split[1], queue=queue)
+    model.finalize_fit()
+    model2.finalize_fit()
+
+    assert_allclose(model.coef_, model2.coef_)
+    assert_allclose(model.intercept_, model2.intercept_)
+
+
 @pytest.mark.parametrize("queue", get_queues())
 @pytest.mark.parametrize("num_blocks", [1, 2, 10])
 @pytest.mark.parametrize("dtype", [np.float32, np.float64])
@@ -144,6 +172,24 @@ def test_no_intercept_results(queue, num_blocks, dtype):
     assert_allclose(gtr, res, rtol=tol)
 
 
+@pytest.mark.parametrize("queue", get_queues())
+def test_integer_data(queue):
+    gen = np.random.default_rng(42)
+    X = gen.integers(0, 10, size=(500, 5))
+    y = X @ np.arange(1, 6) + 3
+    X_split = np.array_split(X, 2)
+    y_split = np.array_split(y, 2)
+
+    model = IncrementalLinearRegression(fit_intercept=True)
+    for i in range(2):
+        model.partial_fit(X_split[i], y_split[i], queue=queue)
+    model.finalize_fit()
+
+    assert model.coef_.dtype == np.float64
+    assert_allclose(np.arange(1, 6), model.coef_, rtol=1e-7)
+    assert_allclose(3, model.intercept_, rtol=1e-7)
+
+
 @pytest.mark.parametrize("queue", get_queues())
 @pytest.mark.parametrize("dtype", [np.float32, np.float64])
 def test_reconstruct_model(queue, dtype):
@@ -108,7 +108,9 @@ class NeighborsCommonBase(BaseEstimator, metaclass=ABCMeta):
                     dist = 1.0 / dist
                 inf_mask = np.isinf(dist)
                 inf_row = np.any(inf_mask, axis=1)
-                dist[inf_row] = inf_mask[inf_row]
+                # exact matches are rare, skip the masked update without them
+                if inf_row.any():
+                    dist[inf_row] = inf_mask[inf_row]
             return dist
         elif callable(weights):
             return weights(dist)
@@ -118,27 +120,43 @@ class NeighborsCommonBase(BaseEstimator, metaclass=ABCMeta):
                 "'distance', or a callable function"
             )
 
+    def _use_daal4py(self, queue):
+        # euclidean search on the host runs through the daal4py kernels
+        return self.effective_metric_ == "euclidean" and not (
+            queue is not None and queue.sycl_device.is_gpu
+        )
+
+    def _get_onedal_base_params(self):
+        # parameters that do not depend on the data, built once per fit
+        base_params = getattr(self, "_onedal_base_params", None)
+        if base_params is None:
+            class_count = 0 if self.classes_ is None else len(self.classes_)
+            weights = getattr(self, "weights", "uniform")
+            if self.effective_metric_ == "manhattan":
+                p = 1.0
+            elif self.effective_metric_ == "euclidean":
+                p = 2.0
+            else:
+                p = self.p
+            base_params = self._onedal_base_params = {
+                "vote_weights": "uniform" if weights == "uniform" else "distance",
+                "method": self._fit_method,
+                "radius": self.radius,
+                "class_count": class_count,
+                "metric": self.effective_metric_,
+                "p": p,
+                "metric_params": self.effective_metric_params_,
+            }
+        return base_params
+
     def _get_onedal_params(self, X, y=None, n_neighbors=None):
-        class_count = 0 if self.classes_ is None else len(self.classes_)
-        weights = getattr(self, "weights", "uniform")
-        if self.effective_metric_ == "manhattan":
-            p = 1.0
-        elif self.effective_metric_ == "euclidean":
-            p = 2.0
-        else:
-            p = self.p
-        return {
-            "fptype": "float" if X.dtype == np.float32 else "double",
-            "vote_weights": "uniform" if weights == "uniform" else "distance",
-            "method": self._fit_method,
-            "radius": self.radius,
-            "class_count": class_count,
-            "neighbor_count": self.n_neighbors if n_neighbors is None else n_neighbors,
-            "metric": self.effective_metric_,
-            "p": p,
-            "metric_params": self.effective_metric_params_,
-            "result_option": "indices|distances" if y is None else "responses",
-        }
+        params = self._get_onedal_base_params().copy()
+        params["fptype"] = "float" if X.dtype == np.float32 else "double"
+        params["neighbor_count"] = (
+            self.n_neighbors if n_neighbors is None else n_neighbors
+        )
+        params["result_option"] = "indices|distances" if y is None else "responses"
+        return params
 
     def _get_daal_params(self, data, n_neighbors=None):
         class_count = 0 if self.classes_ is None else len(self.classes_)
@@ -185,6 +203,20 @@ class NeighborsBase(NeighborsCommonBase, metaclass=ABCMeta):
         except ValueError:
             return arr
 
+    def _encode_targets(self, y):
+        # Small non-negative integer labels are counted instead of sorted,
+        # and used as indices directly if they already are 0, ..., n_classes - 1.
+        if y.dtype.kind in "iu" and y.size > 0 and y.min() >= 0 and y.max() < 256:
+            y_idx = y.astype(np.intp)
+            counts = np.bincount(y_idx)
+            classes = np.flatnonzero(counts).astype(y.dtype, copy=False)
+            if classes.size == counts.size:
+                return classes, y_idx
+            encoding = np.zeros(counts.size, dtype=np.intp)
+            encoding[classes] = np.arange(classes.size)
+            return classes, encoding[y_idx]
+        return np.unique(y, return_inverse=True)
+
     def _validate_n_classes(self):
         if len(self.classes_) < 2:
             raise ValueError(
@@ -194,6 +226,7 @@ class NeighborsBase(NeighborsCommonBase, metaclass=ABCMeta):
 
     def _fit(self, X, y, queue):
         self._onedal_model = None
+        self._onedal_base_params = None
         self._tree = None
         self._shape = None
         self.classes_ = None
@@ -217,15 +250,16 @@ class NeighborsBase(NeighborsCommonBase, metaclass=ABCMeta):
                     self.outputs_2d_ = True
 
                 _check_classification_targets(y)
-                self.classes_ = []
-                self._y = np.empty(y.shape, dtype=int)
-                for k in range(self._y.shape[1]):
-                    classes, self._y[:, k] = np.unique(y[:, k], return_inverse=True)
-                    self.classes_.append(classes)
-
                 if not self.outputs_2d_:
-                    self.classes_ = self.classes_[0]
-                    self._y = self._y.ravel()
+                    # single output, encode the column without the
+                    # per-output scratch array
+                    self.classes_, self._y = self._encode_targets(y.ravel())
+                else:
+                    self.classes_ = []
+                    self._y = np.empty(y.shape, dtype=int)
+                    for k in range(self._y.shape[1]):
+                        classes, self._y[:, k] = np.unique(y[:, k], return_inverse=True)
+                        self.classes_.append(classes)
 
                 self._validate_n_classes()
             else:
@@ -265,6 +299,23 @@ class NeighborsBase(NeighborsCommonBase, metaclass=ABCMeta):
 
         return result
 
+    def _validate_predict_data(self, X):
+        # shared preamble of the predict methods, runs once per call
+        X = _check_array(X, accept_sparse="csr", dtype=[np.float64, np.float32])
+        n_features = getattr(self, "n_features_in_", None)
+        shape = getattr(X, "shape", None)
+        if n_features and shape and len(shape) > 1 and shape[1] != n_features:
+            raise ValueError(
+                (
+                    f"X has {X.shape[1]} features, "
+                    f"but KNNClassifier is expecting "
+                    f"{n_features} features as input"
+                )
+            )
+
+        _check_is_fitted(self)
+        return X
+
     def _kneighbors(self, X=None, n_neighbors=None, return_distance=True, queue=None):
         n_features = getattr(self, "n_features_in_", None)
         shape = getattr(X, "shape", None)
@@ -313,13 +364,11 @@ class NeighborsBase(NeighborsCommonBase, metaclass=ABCMeta):
                 f"n_samples = {X.shape[0]}"  # include n_samples for common tests
             )
 
-        chunked_results = None
-        method = super()._parse_auto_method(
-            self._fit_method, self.n_samples_fit_, n_features
-        )
+        # resolved in _fit, it has to match the kind of the trained model
+        method = self._fit_method
 
-        gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        use_daal4py = self._use_daal4py(queue)
+        if use_daal4py:
             params = super()._get_daal_params(X, n_neighbors=n_neighbors)
         else:
             params = super()._get_onedal_params(X, n_neighbors=n_neighbors)
@@ -328,7 +377,7 @@ class NeighborsBase(NeighborsCommonBase, metaclass=ABCMeta):
             self._onedal_model, X, params, queue=queue
         )
 
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if use_daal4py:
             distances = prediction_results.distances
             indices = prediction_results.indices
         else:
@@ -336,49 +385,35 @@ class NeighborsBase(NeighborsCommonBase, metaclass=ABCMeta):
             indices = from_table(prediction_results.indices)
 
         if method == "kd_tree":
-            for i in range(distances.shape[0]):
-                seq = distances[i].argsort()
-                indices[i] = indices[i][seq]
-                distances[i] = distances[i][seq]
-
-        if return_distance:
-            results = distances, indices
-        else:
-            results = indices
-
-        if chunked_results is not None:
-            if return_distance:
-                neigh_dist, neigh_ind = zip(*chunked_results)
-                results = np.vstack(neigh_dist), np.vstack(neigh_ind)
-            else:
-                results = np.vstack(chunked_results)
+            seq = distances.argsort(axis=1)
+            indices = np.take_along_axis(indices, seq, axis=1)
+            distances = np.take_along_axis(distances, seq, axis=1)
 
         if not query_is_train:
-            return results
+            return (distances, indices) if return_distance else indices
 
         # If the query data is the same as the indexed data, we would like
         # to ignore the first nearest neighbor of every sample, i.e
         # the sample itself.
-        if return_distance:
-            neigh_dist, neigh_ind = results
-        else:
-            neigh_ind = results
+        neigh_dist, neigh_ind = distances, indices
 
         n_queries, _ = X.shape
         sample_range = np.arange(n_queries)[:, None]
-        sample_mask = neigh_ind != sample_range
 
-        # Corner case: When the number of duplicates are more
-        # than the number of neighbors, the first NN will not
-        # be the sample, but a duplicate.
-        # In that case mask the first duplicate.
-        dup_gr_nbrs = np.all(sample_mask, axis=1)
-        sample_mask[:, 0][dup_gr_nbrs] = False
+        # Column of the sample itself in every row. Corner case: When the
+        # number of duplicates are more than the number of neighbors, the
+        # first NN will not be the sample, but a duplicate. argmax of an
+        # all-False row is 0, so in that case the first duplicate is dropped.
+        sample_col = np.argmax(neigh_ind == sample_range, axis=1)[:, None]
 
-        neigh_ind = np.reshape(neigh_ind[sample_mask], (n_queries, n_neighbors - 1))
+        # gather the remaining columns, skipping over the sample column
+        kept_cols = np.arange(n_neighbors - 1)[None, :]
+        kept_cols = kept_cols + (kept_cols >= sample_col)
+
+        neigh_ind = np.take_along_axis(neigh_ind, kept_cols, axis=1)
 
         if return_distance:
-            neigh_dist = np.reshape(neigh_dist[sample_mask], (n_queries, n_neighbors - 1))
+            neigh_dist = np.take_along_axis(neigh_dist, kept_cols, axis=1)
             return neigh_dist, neigh_ind
         return neigh_ind
 
@@ -412,8 +447,7 @@ class KNeighborsClassifier(NeighborsBase, ClassifierMixin):
         return params
 
     def _onedal_fit(self, X, y, queue):
-        gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if self._use_daal4py(queue):
             params = self._get_daal_params(X)
             if self._fit_method == "brute":
                 train_alg = bf_knn_classification_training
@@ -433,8 +467,7 @@ class KNeighborsClassifier(NeighborsBase, ClassifierMixin):
         return train_alg.model
 
     def _onedal_predict(self, model, X, params, queue):
-        gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if self._use_daal4py(queue):
             if self._fit_method == "brute":
                 predict_alg = bf_knn_classification_prediction
 
@@ -464,36 +497,19 @@ class KNeighborsClassifier(NeighborsBase, ClassifierMixin):
         return super()._fit(X, y, queue=queue)
 
     def predict(self, X, queue=None):
-        X = _check_array(X, accept_sparse="csr", dtype=[np.float64, np.float32])
+        X = self._validate_predict_data(X)
         onedal_model = getattr(self, "_onedal_model", None)
-        n_features = getattr(self, "n_features_in_", None)
-        n_samples_fit_ = getattr(self, "n_samples_fit_", None)
-        shape = getattr(X, "shape", None)
-        if n_features and shape and len(shape) > 1 and shape[1] != n_features:
-            raise ValueError(
-                (
-                    f"X has {X.shape[1]} features, "
-                    f"but KNNClassifier is expecting "
-                    f"{n_features} features as input"
-                )
-            )
-
-        _check_is_fitted(self)
-
-        self._fit_method = super()._parse_auto_method(
-            self.algorithm, n_samples_fit_, n_features
-        )
 
         self._validate_n_classes()
 
-        gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        use_daal4py = self._use_daal4py(queue)
+        if use_daal4py:
             params = self._get_daal_params(X)
         else:
             params = self._get_onedal_params(X)
 
         prediction_result = self._onedal_predict(onedal_model, X, params, queue=queue)
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if use_daal4py:
             responses = prediction_result.prediction
         else:
             responses = from_table(prediction_result.responses)
@@ -513,23 +529,30 @@ class KNeighborsClassifier(NeighborsBase, ClassifierMixin):
         n_queries = _num_samples(X)
 
         weights = self._get_weights(neigh_dist, self.weights)
-        if weights is None:
-            weights = np.ones_like(neigh_ind)
+        if weights is not None:
+            weights = np.ravel(weights)
 
-        all_rows = np.arange(n_queries)
+        all_rows = np.arange(n_queries)[:, np.newaxis]
         probabilities = []
         for k, classes_k in enumerate(classes_):
             pred_labels = _y[:, k][neigh_ind]
-            proba_k = np.zeros((n_queries, classes_k.size))
 
-            # a simple ':' index doesn't work right
-            for i, idx in enumerate(pred_labels.T):  # loop is O(n_neighbors)
-                proba_k[all_rows, idx] += weights[:, i]
+            # accumulate the votes of all neighbors in one pass by counting
+            # them in the flattened (n_queries, n_classes) grid
+            n_bins = n_queries * classes_k.size
+            bins = (all_rows * classes_k.size + pred_labels).ravel()
+            proba_k = np.bincount(bins, weights=weights, minlength=n_bins)
+            proba_k = proba_k.reshape((n_queries, classes_k.size))
 
             # normalize 'votes' into real [0,1] probabilities
-            normalizer = proba_k.sum(axis=1)[:, np.newaxis]
-            normalizer[normalizer == 0.0] = 1.0
-            proba_k /= normalizer
+            if weights is None:
+                # every row holds exactly n_neighbors integer votes, the
+                # division also produces the float64 result
+                proba_k = proba_k / neigh_ind.shape[1]
+            else:
+                normalizer = proba_k.sum(axis=1)[:, np.newaxis]
+                normalizer[normalizer == 0.0] = 1.0
+                proba_k /= normalizer
 
             probabilities.append(proba_k)
 
@@ -576,7 +599,7 @@ class KNeighborsRegressor(NeighborsBase, RegressorMixin):
 
     def _onedal_fit(self, X, y, queue):
         gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if self._use_daal4py(queue):
             params = self._get_daal_params(X)
             if self._fit_method == "brute":
                 train_alg = bf_knn_classification_training
@@ -598,7 +621,7 @@ class KNeighborsRegressor(NeighborsBase, RegressorMixin):
 
     def _onedal_predict(self, model, X, params, queue):
         gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if self._use_daal4py(queue):
             if self._fit_method == "brute":
                 predict_alg = bf_knn_classification_prediction
 
@@ -633,25 +656,8 @@ class KNeighborsRegressor(NeighborsBase, RegressorMixin):
         return super()._kneighbors(X, n_neighbors, return_distance, queue=queue)
 
     def _predict_gpu(self, X, queue=None):
-        X = _check_array(X, accept_sparse="csr", dtype=[np.float64, np.float32])
+        X = self._validate_predict_data(X)
         onedal_model = getattr(self, "_onedal_model", None)
-        n_features = getattr(self, "n_features_in_", None)
-        n_samples_fit_ = getattr(self, "n_samples_fit_", None)
-        shape = getattr(X, "shape", None)
-        if n_features and shape and len(shape) > 1 and shape[1] != n_features:
-            raise ValueError(
-                (
-                    f"X has {X.shape[1]} features, "
-                    f"but KNNClassifier is expecting "
-                    f"{n_features} features as input"
-                )
-            )
-
-        _check_is_fitted(self)
-
-        self._fit_method = super()._parse_auto_method(
-            self.algorithm, n_samples_fit_, n_features
-        )
 
         params = self._get_onedal_params(X)
 
@@ -670,15 +676,13 @@ class KNeighborsRegressor(NeighborsBase, RegressorMixin):
         if _y.ndim == 1:
             _y = _y.reshape((-1, 1))
 
+        neigh_y = _y[neigh_ind]
         if weights is None:
-            y_pred = np.mean(_y[neigh_ind], axis=1)
+            y_pred = np.mean(neigh_y, axis=1)
         else:
-            y_pred = np.empty((X.shape[0], _y.shape[1]), dtype=np.float64)
-            denom = np.sum(weights, axis=1)
-
-            for j in range(_y.shape[1]):
-                num = np.sum(_y[neigh_ind, j] * weights, axis=1)
-                y_pred[:, j] = num / denom
+            # weighted sum over the neighbors for all outputs at once
+            y_pred = np.einsum("qk,qko->qo", weights, neigh_y, dtype=np.float64)
+            y_pred /= np.sum(weights, axis=1)[:, np.newaxis]
 
         if self._y.ndim == 1:
             y_pred = y_pred.ravel()
@@ -726,8 +730,7 @@ class NearestNeighbors(NeighborsBase):
         return params
 
     def _onedal_fit(self, X, y, queue):
-        gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if self._use_daal4py(queue):
             params = self._get_daal_params(X)
             if self._fit_method == "brute":
                 train_alg = bf_knn_classification_training
@@ -747,8 +750,7 @@ class NearestNeighbors(NeighborsBase):
         return train_alg.model
 
     def _onedal_predict(self, model, X, params, queue):
-        gpu_device = queue is not None and queue.sycl_device.is_gpu
-        if self.effective_metric_ == "euclidean" and not gpu_device:
+        if self._use_daal4py(queue):
             if self._fit_method == "brute":
                 predict_alg = bf_knn_classification_prediction
 
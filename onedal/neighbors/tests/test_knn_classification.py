@@ -16,8 +16,9 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal
 from sklearn import datasets
+from sklearn.neighbors import KNeighborsClassifier as SklearnKNeighborsClassifier
 
 from onedal.neighbors import KNeighborsClassifier
 from onedal.tests.utils._device_selection import get_queues
@@ -46,3 +47,37 @@ def test_pickle(queue):
     assert type(clf2) == clf.__class__
     result = clf2.predict(iris.data, queue=queue)
     assert_array_equal(expected, result)
+
+
+@pytest.mark.parametrize("queue", get_queues())
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+def test_predict_proba(queue, weights):
+    gen = np.random.default_rng(42)
+    X, y = gen.random(size=(200, 4)), gen.integers(0, 3, size=200)
+    X_test = gen.random(size=(50, 4))
+
+    clf = KNeighborsClassifier(7, weights=weights).fit(X, y, queue=queue)
+    result = clf.predict_proba(X_test, queue=queue)
+
+    clf_sklearn = SklearnKNeighborsClassifier(7, weights=weights).fit(X, y)
+    expected = clf_sklearn.predict_proba(X_test)
+    assert_allclose(expected, result)
+
+
+@pytest.mark.parametrize("queue", get_queues())
+@pytest.mark.parametrize("labels", [[0, 1, 2], [2, 5, 7]])
+@pytest.mark.parametrize("dtype", [np.int32, np.uint64])
+def test_integer_labels(queue, labels, dtype):
+    iris = datasets.load_iris()
+    y = np.asarray(labels, dtype=dtype)[iris.target]
+    clf = KNeighborsClassifier(2).fit(iris.data, y, queue=queue)
+    assert_array_equal(clf.classes_, np.unique(y))
+    assert clf.classes_.dtype == y.dtype
+
+    clf_ref = KNeighborsClassifier(2).fit(iris.data, iris.target, queue=queue)
+    expected = np.asarray(labels)[clf_ref.predict(iris.data, queue=queue)]
+    assert_array_equal(expected, clf.predict(iris.data, queue=queue))
+    assert_allclose(
+        clf_ref.predict_proba(iris.data, queue=queue),
+        clf.predict_proba(iris.data, queue=queue),
+    )
@@ -25,6 +25,7 @@ from sklearn.utils import check_array, gen_batches
 
 from daal4py.sklearn._n_jobs_support import control_n_jobs
 from daal4py.sklearn._utils import daal_check_version, sklearn_check_version
+from daal4py.sklearn.utils import _assert_all_finite
 from onedal.covariance import (
     IncrementalEmpiricalCovariance as onedal_IncrementalEmpiricalCovariance,
 )
@@ -151,7 +152,7 @@ class IncrementalEmpiricalCovariance(BaseEstimator):
                 f"'{self.__class__.__name__}' object has no attribute 'location_'"
             )
 
-    def _onedal_partial_fit(self, X, queue=None, check_input=True):
+    def _onedal_partial_fit(self, X, queue=None, check_input=True, validated=False):
 
         first_pass = not hasattr(self, "n_samples_seen_") or self.n_samples_seen_ == 0
 
@@ -190,7 +191,9 @@ class IncrementalEmpiricalCovariance(BaseEstimator):
             else:
                 self.n_samples_seen_ += X.shape[0]
 
-            self._onedal_estimator.partial_fit(X, queue)
+            # the onedal side still checks the data unless fit has already
+            # fully validated it, finite check included
+            self._onedal_estimator.partial_fit(X, queue=queue, check_input=not validated)
         finally:
             self._need_to_finalize = True
 
@@ -265,16 +268,26 @@ class IncrementalEmpiricalCovariance(BaseEstimator):
         if sklearn_check_version("1.2"):
             self._validate_params()
 
-        # finite check occurs on onedal side
+        # C order keeps every row batch contiguous, so the batches
+        # can skip validation on the onedal side
         if sklearn_check_version("1.0"):
             X = self._validate_data(
-                X, dtype=[np.float64, np.float32], copy=self.copy, force_all_finite=False
+                X,
+                dtype=[np.float64, np.float32],
+                order="C",
+                copy=self.copy,
+                force_all_finite=False,
             )
         else:
             X = check_array(
-                X, dtype=[np.float64, np.float32], copy=self.copy, force_all_finite=False
+                X,
+                dtype=[np.float64, np.float32],
+                order="C",
+                copy=self.copy,
+                force_all_finite=False,
             )
             self.n_features_in_ = X.shape[1]
+        _assert_all_finite(X)
 
         self.batch_size_ = self.batch_size if self.batch_size else 5 * self.n_features_in_
 
@@ -285,7 +298,9 @@ class IncrementalEmpiricalCovariance(BaseEstimator):
 
         for batch in gen_batches(X.shape[0], self.batch_size_):
             X_batch = X[batch]
-            self._onedal_partial_fit(X_batch, queue=queue, check_input=False)
+            self._onedal_partial_fit(
+                X_batch, queue=queue, check_input=False, validated=True
+            )
 
         self._onedal_finalize_fit()
 
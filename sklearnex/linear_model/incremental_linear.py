@@ -154,7 +154,7 @@ class IncrementalLinearRegression(MultiOutputMixin, RegressorMixin, BaseEstimato
             y, self._onedal_predict(X, queue=queue), sample_weight=sample_weight
         )
 
-    def _onedal_partial_fit(self, X, y, check_input=True, queue=None):
+    def _onedal_partial_fit(self, X, y, check_input=True, queue=None, validated=False):
         first_pass = not hasattr(self, "n_samples_seen_") or self.n_samples_seen_ == 0
 
         if sklearn_check_version("1.2"):
@@ -194,7 +194,9 @@ class IncrementalLinearRegression(MultiOutputMixin, RegressorMixin, BaseEstimato
         onedal_params = {"fit_intercept": self.fit_intercept, "copy_X": self.copy_X}
         if not hasattr(self, "_onedal_estimator"):
             self._onedal_estimator = self._onedal_incremental_linear(**onedal_params)
-        self._onedal_estimator.partial_fit(X, y, queue)
+        # the onedal side still checks the data unless fit has already
+        # fully validated it, finite check included
+        self._onedal_estimator.partial_fit(X, y, queue=queue, check_input=not validated)
         self._need_to_finalize = True
 
     def _onedal_finalize_fit(self):
@@ -211,11 +213,15 @@ class IncrementalLinearRegression(MultiOutputMixin, RegressorMixin, BaseEstimato
         if sklearn_check_version("1.2"):
             self._validate_params()
 
+        # X and y are fully validated here, so the batches below skip
+        # validation on the onedal side. C order keeps every row batch
+        # of X contiguous.
         if sklearn_check_version("1.0"):
             X, y = self._validate_data(
                 X,
                 y,
                 dtype=[np.float64, np.float32],
+                order="C",
                 copy=self.copy_X,
                 multi_output=True,
                 ensure_2d=True,
@@ -224,6 +230,7 @@ class IncrementalLinearRegression(MultiOutputMixin, RegressorMixin, BaseEstimato
             X = check_array(
                 X,
                 dtype=[np.float64, np.float32],
+                order="C",
                 copy=self.copy_X,
             )
             y = check_array(
@@ -250,12 +257,13 @@ class IncrementalLinearRegression(MultiOutputMixin, RegressorMixin, BaseEstimato
 
         for batch in gen_batches(n_samples, self.batch_size_):
             X_batch, y_batch = X[batch], y[batch]
-            self._onedal_partial_fit(X_batch, y_batch, check_input=False, queue=queue)
+            self._onedal_partial_fit(
+                X_batch, y_batch, check_input=False, queue=queue, validated=True
+            )
 
         if sklearn_check_version("1.2"):
             self._validate_params()
 
-        # finite check occurs on onedal side
         self.n_features_in_ = n_features
 
         if n_samples == 1: